@@ -1,17 +1,29 @@
 import argparse
 import contextlib
+import copy
+import functools
 import gc
 import importlib
+import inspect
 import math
+import mmap
 import os
+import queue
+import re
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, TextIO, Union
 
+import numpy as np
 import openai
 import torch
 
@@ -27,9 +39,138 @@ SUPPORTED_EXTENSIONS: tuple[str, ...] = (
     ".opus",
     ".mp4",
 )
+_SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(SUPPORTED_EXTENSIONS)
 
 PROCESSING_FOLDER = Path(__file__).resolve().parent / "processing"
+# Chunks are cut here rather than beside the source, so synced folders (OneDrive, SMB) never see them
+SCRATCH_DIR = Path(os.getenv("AUDIO_NOTES_SCRATCH_DIR") or Path(tempfile.gettempdir()) / "audio_notes")
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+FFMPEG_LOGLEVEL = "error"  # Progress/banner output to the console slows long conversions
+DEFAULT_MODEL_NAME = "nvidia/canary-qwen-2.5b"
 DEFAULT_CHUNK_LENGTH_SEC = 40  # Canary-Qwen performs best around 30–45s chunks
+MODEL_SAMPLE_RATE = 16000  # Canary-Qwen's encoder expects 16 kHz mono input
+DEFAULT_BATCH_SIZE = 4  # Chunks per generate call; lower it if VRAM runs out
+SPLIT_MODES: tuple[str, ...] = ("fixed", "vad")
+DEFAULT_SPLIT_MODE = "fixed"
+VAD_NOISE_DB = -35  # silencedetect threshold; quieter than this counts as silence
+VAD_MIN_SILENCE_SEC = 0.5  # Shortest pause treated as a cut point
+REPEAT_NGRAM = 4  # Phrase length checked for back-to-back repeats in the transcript
+REPEAT_MIN_RUN = 3  # Consecutive copies of a phrase before the extras are dropped
+NOTES_MAX_WORKERS = 4  # Concurrent GPT note requests while the next file transcribes
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?\d+(?:\.\d+)?)")
+_OUTPUT_KINDS = frozenset({"transcription", "notes"})
+_OUTPUT_NAME_RE = re.compile(r"^(?P<base>.+)_\d{8}-\d{6}-(?P<kind>transcription|notes)\.txt$")
+LOOP_IDLE_WAIT_SEC = 1.0  # Back-off between loop sweeps when no new file event arrives
+
+# Called as (chunks transcribed, expected chunks) after each batch; the total is 0 when unknown.
+ProgressCallback = Callable[[int, int], None]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_salm_cls() -> type:
+    """Apply the torch compatibility shims NeMo expects, then import SALM (once per process)."""
+    fsdp_module = importlib.import_module("torch.distributed.fsdp")
+    if not hasattr(fsdp_module, "fully_shard"):
+
+        def _passthrough_fully_shard(target=None, *_, **__):
+            return target
+
+        fsdp_module.fully_shard = _passthrough_fully_shard  # type: ignore[attr-defined]
+    dtensor_module = importlib.import_module("torch.distributed.tensor")
+    if not hasattr(dtensor_module, "Replicate"):
+
+        class _Replicate:
+            def __repr__(self) -> str:  # pragma: no cover - trivial
+                return "Replicate()"
+
+        dtensor_module.Replicate = _Replicate  # type: ignore[attr-defined]
+    if not hasattr(dtensor_module, "Shard"):
+
+        class _Shard:
+            def __init__(self, dim: int) -> None:
+                self.dim = dim
+
+            def __repr__(self) -> str:  # pragma: no cover - trivial
+                return f"Shard(dim={self.dim})"
+
+        dtensor_module.Shard = _Shard  # type: ignore[attr-defined]
+    if hasattr(dtensor_module, "__all__"):
+        for _symbol in ("Replicate", "Shard"):
+            if _symbol not in dtensor_module.__all__:
+                dtensor_module.__all__.append(_symbol)
+    # PyTorch 2.4 lacks the padding_side keyword that NeMo expects.
+    rnn_module = importlib.import_module("torch.nn.utils.rnn")
+    pad_sequence_fn = getattr(rnn_module, "pad_sequence")
+    if "padding_side" not in inspect.signature(pad_sequence_fn).parameters:
+        original_pad_sequence = pad_sequence_fn
+
+        def _pad_sequence_with_side(
+            sequences,
+            batch_first: bool = False,
+            padding_value: float = 0.0,
+            padding_side: str = "right",
+        ):
+            if padding_side == "right":
+                return original_pad_sequence(sequences, batch_first=batch_first, padding_value=padding_value)
+            if padding_side != "left":
+                raise ValueError(f"Unsupported padding_side: {padding_side}")
+            if not sequences:
+                return original_pad_sequence(sequences, batch_first=batch_first, padding_value=padding_value)
+
+            # Left padding == right-padding the reversed sequences, then reversing the time axis.
+            reversed_sequences = [seq.flip(0) for seq in sequences]
+            output = original_pad_sequence(reversed_sequences, batch_first=batch_first, padding_value=padding_value)
+            return output.flip(1 if batch_first else 0)
+
+        rnn_module.pad_sequence = _pad_sequence_with_side  # type: ignore[assignment]
+    salm_module = importlib.import_module("nemo.collections.speechlm2.models.salm")
+    return getattr(salm_module, "SALM")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_base_from_pretrained():
+    """Return PyTorchModelHubMixin._from_pretrained bound to SALM, resolved once per process."""
+    salm_cls = _load_salm_cls()
+    for base in salm_cls.__mro__:
+        if base.__name__ == "PyTorchModelHubMixin":
+            return base._from_pretrained.__get__(salm_cls, salm_cls)
+    raise RuntimeError("PyTorchModelHubMixin not found in SALM inheritance chain")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cfg_dict(model_name: str) -> dict:
+    """Resolve and parse the SALM config once per model; callers must copy before mutating."""
+    _load_salm_cls()  # NeMo's hf_hub import needs the torch shims in place.
+    hf_parts_module = importlib.import_module("nemo.collections.speechlm2.parts.hf_hub")
+    omegaconf_module = importlib.import_module("omegaconf")
+    transformers_utils = importlib.import_module("transformers.utils")
+
+    cached_file_fn = getattr(transformers_utils, "cached_file")
+    omega_conf = getattr(omegaconf_module, "OmegaConf")
+    config_name = getattr(hf_parts_module, "CONFIG_NAME")
+
+    resolved_config = cached_file_fn(
+        model_name,
+        config_name,
+        cache_dir=None,
+        force_download=False,
+        proxies=None,
+        resume_download=False,
+        local_files_only=False,
+        token=None,
+        revision=None,
+        _raise_exceptions_for_gated_repo=False,
+        _raise_exceptions_for_missing_entries=False,
+        _raise_exceptions_for_connection_errors=False,
+    )
+    if resolved_config is None:
+        raise RuntimeError(f"Missing {config_name} for {model_name}")
+
+    cfg_dict = omega_conf.to_container(omega_conf.load(resolved_config))
+    if not isinstance(cfg_dict, dict):
+        raise TypeError("Expected model config to deserialize to a dict")
+    cfg_dict["pretrained_weights"] = False
+    return cfg_dict
 
 
 class CanaryTranscriber:
@@ -38,118 +179,15 @@ class CanaryTranscriber:
     def __init__(
         self,
         *,
-        model_name: str = "nvidia/canary-qwen-2.5b",
+        model_name: str = DEFAULT_MODEL_NAME,
         max_new_tokens: int = 512,
         device: Optional[str] = None,
     ) -> None:
         self.device = device or ("cuda:0" if torch.cuda.is_available() else "cpu")
         self.max_new_tokens = max_new_tokens
         print(f"Loading Canary-Qwen model on {self.device}...")
-        fsdp_module = importlib.import_module("torch.distributed.fsdp")
-        if not hasattr(fsdp_module, "fully_shard"):
-
-            def _passthrough_fully_shard(target=None, *_, **__):
-                return target
-
-            fsdp_module.fully_shard = _passthrough_fully_shard  # type: ignore[attr-defined]
-        dtensor_module = importlib.import_module("torch.distributed.tensor")
-        if not hasattr(dtensor_module, "Replicate"):
-
-            class _Replicate:
-                def __repr__(self) -> str:  # pragma: no cover - trivial
-                    return "Replicate()"
-
-            dtensor_module.Replicate = _Replicate  # type: ignore[attr-defined]
-        if not hasattr(dtensor_module, "Shard"):
-
-            class _Shard:
-                def __init__(self, dim: int) -> None:
-                    self.dim = dim
-
-                def __repr__(self) -> str:  # pragma: no cover - trivial
-                    return f"Shard(dim={self.dim})"
-
-            dtensor_module.Shard = _Shard  # type: ignore[attr-defined]
-        if hasattr(dtensor_module, "__all__"):
-            for _symbol in ("Replicate", "Shard"):
-                if _symbol not in dtensor_module.__all__:
-                    dtensor_module.__all__.append(_symbol)
-        # PyTorch 2.4 lacks the padding_side keyword that NeMo expects.
-        rnn_module = importlib.import_module("torch.nn.utils.rnn")
-        pad_sequence_fn = getattr(rnn_module, "pad_sequence")
-        import inspect
-
-        if "padding_side" not in inspect.signature(pad_sequence_fn).parameters:
-            original_pad_sequence = pad_sequence_fn
-
-            def _pad_sequence_with_side(
-                sequences,
-                batch_first: bool = False,
-                padding_value: float = 0.0,
-                padding_side: str = "right",
-            ):
-                if padding_side == "right":
-                    return original_pad_sequence(sequences, batch_first=batch_first, padding_value=padding_value)
-                if padding_side != "left":
-                    raise ValueError(f"Unsupported padding_side: {padding_side}")
-                if not sequences:
-                    return original_pad_sequence(sequences, batch_first=batch_first, padding_value=padding_value)
-
-                max_len = max(seq.size(0) for seq in sequences)
-                trailing_shape = sequences[0].shape[1:]
-                output_shape = (len(sequences), max_len, *trailing_shape) if batch_first else (max_len, len(sequences), *trailing_shape)
-                output = sequences[0].new_full(output_shape, padding_value)
-
-                if batch_first:
-                    for idx, seq in enumerate(sequences):
-                        length = seq.size(0)
-                        output[idx, max_len - length :] = seq
-                else:
-                    for idx, seq in enumerate(sequences):
-                        length = seq.size(0)
-                        output[max_len - length :, idx] = seq
-                return output
-
-            rnn_module.pad_sequence = _pad_sequence_with_side  # type: ignore[assignment]
-        salm_module = importlib.import_module("nemo.collections.speechlm2.models.salm")
-        salm_cls = getattr(salm_module, "SALM")
-        hf_parts_module = importlib.import_module("nemo.collections.speechlm2.parts.hf_hub")
-        omegaconf_module = importlib.import_module("omegaconf")
-        transformers_utils = importlib.import_module("transformers.utils")
-
-        cached_file_fn = getattr(transformers_utils, "cached_file")
-        omega_conf = getattr(omegaconf_module, "OmegaConf")
-        config_name = getattr(hf_parts_module, "CONFIG_NAME")
-
-        resolved_config = cached_file_fn(
-            model_name,
-            config_name,
-            cache_dir=None,
-            force_download=False,
-            proxies=None,
-            resume_download=False,
-            local_files_only=False,
-            token=None,
-            revision=None,
-            _raise_exceptions_for_gated_repo=False,
-            _raise_exceptions_for_missing_entries=False,
-            _raise_exceptions_for_connection_errors=False,
-        )
-        if resolved_config is None:
-            raise RuntimeError(f"Missing {config_name} for {model_name}")
-
-        cfg_dict = omega_conf.to_container(omega_conf.load(resolved_config))
-        if not isinstance(cfg_dict, dict):
-            raise TypeError("Expected model config to deserialize to a dict")
-        cfg_dict["pretrained_weights"] = False
-
-        base_from_pretrained = None
-        for base in salm_cls.__mro__:
-            if base.__name__ == "PyTorchModelHubMixin":
-                base_from_pretrained = base._from_pretrained.__get__(salm_cls, salm_cls)
-                break
-        if base_from_pretrained is None:
-            raise RuntimeError("PyTorchModelHubMixin not found in SALM inheritance chain")
+        base_from_pretrained = _load_base_from_pretrained()
+        cfg_dict = copy.deepcopy(_load_cfg_dict(model_name))
 
         # Load weights via the vanilla PyTorchModelHubMixin to avoid extra kwargs that Nemo's mixin forwards.
         self.model = base_from_pretrained(
@@ -165,18 +203,67 @@ class CanaryTranscriber:
         )
         self.model.to(self.device)
         self.model.eval()
+        # Reduced precision halves memory traffic for the LLM decoder; BF16 where the GPU has it.
+        self.autocast_dtype: Optional[torch.dtype] = None
+        if self.device.startswith("cuda"):
+            self.autocast_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            # Store the decoder weights at that precision too, rather than re-casting FP32 weights every step.
+            llm = getattr(self.model, "llm", None)
+            if llm is not None:
+                llm.to(dtype=self.autocast_dtype)
         self.prompt_template = "Transcribe the following: {}"
 
     def transcribe(self, audio_path: Path) -> str:
+        return self.transcribe_paths([audio_path])[0]
+
+    def transcribe_paths(self, audio_paths: list[Path]) -> list[str]:
+        """Transcribe several audio files with a single batched ``generate`` call."""
+        prompt = self.prompt_template.format(self.model.audio_locator_tag)
+        prompts = [[{"role": "user", "content": prompt, "audio": [str(path)]}] for path in audio_paths]
+        answer_ids = self._generate(prompts=prompts)
+        return self._decode(answer_ids)
+
+    def transcribe_waveforms(self, waveforms: list[np.ndarray]) -> list[str]:
+        """Transcribe pre-decoded 16 kHz mono float32 waveforms, bypassing NeMo's file loader."""
         prompt = self.prompt_template.format(self.model.audio_locator_tag)
-        prompts = [[{"role": "user", "content": prompt, "audio": [str(audio_path)]}]]
-        with torch.inference_mode():
-            answer_ids = self.model.generate(
-                prompts=prompts,
+        prompts = [[{"role": "user", "content": prompt}] for _ in waveforms]
+        max_len = max(waveform.shape[0] for waveform in waveforms)
+        padded = np.zeros((len(waveforms), max_len), dtype=np.float32)
+        for row, waveform in enumerate(waveforms):
+            padded[row, : waveform.shape[0]] = waveform
+        audios = torch.from_numpy(padded).to(self.device)
+        audio_lens = torch.tensor([waveform.shape[0] for waveform in waveforms], dtype=torch.long, device=self.device)
+        answer_ids = self._generate(prompts=prompts, audios=audios, audio_lens=audio_lens)
+        return self._decode(answer_ids)
+
+    def _generate(self, **generate_kwargs):
+        autocast = (
+            torch.autocast(device_type="cuda", dtype=self.autocast_dtype)
+            if self.autocast_dtype is not None
+            else contextlib.nullcontext()
+        )
+        with torch.inference_mode(), autocast:
+            # Transcription wants the single most likely text: greedy, no beams, no sampling.
+            return self.model.generate(
                 max_new_tokens=self.max_new_tokens,
+                do_sample=False,
+                num_beams=1,
+                **generate_kwargs,
             )
-        transcript = self.model.tokenizer.ids_to_text(answer_ids[0].cpu())
-        return transcript.strip()
+
+    def _decode(self, answer_ids) -> list[str]:
+        tokenizer = self.model.tokenizer
+        # Shorter rows in a batch are padded after EOS; cut them there before detokenizing.
+        stop_ids = {getattr(tokenizer, "eos_id", None), getattr(tokenizer, "pad_id", None)} - {None}
+        transcripts: list[str] = []
+        for row in answer_ids.cpu():
+            ids = row.tolist()
+            for pos, token_id in enumerate(ids):
+                if token_id in stop_ids:
+                    ids = ids[:pos]
+                    break
+            transcripts.append(tokenizer.ids_to_text(ids).strip())
+        return transcripts
 
     def close(self) -> None:
         if hasattr(self, "model"):
@@ -188,30 +275,49 @@ class CanaryTranscriber:
                 torch.cuda.ipc_collect()
 
 
-def convert_to_wav(input_path: Path) -> tuple[Path, bool]:
-    """Return a wav version of the input audio path and whether it is temporary."""
-    input_path = input_path.resolve()
-    if input_path.suffix.lower() == ".wav":
-        return input_path, False
-    output_path = input_path.with_suffix(input_path.suffix + ".converted.wav")
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(input_path),
-        "-ar",
-        "16000",
-        "-ac",
-        "1",
-        str(output_path),
-    ]
-    subprocess.run(cmd, check=True)
-    return output_path, True
+def _find_wav_data_chunk(f: BinaryIO) -> Optional[tuple[int, int, int]]:
+    """Walk the RIFF chunks of an open wav to ``data``; return (offset, size, byte rate) or None if unusual."""
+    riff = f.read(12)
+    if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+        return None
+    byte_rate = 0
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        chunk_id = header[:4]
+        (chunk_size,) = struct.unpack("<I", header[4:])
+        if chunk_id == b"fmt ":
+            fmt = f.read(chunk_size)
+            if len(fmt) < 16:
+                return None
+            (byte_rate,) = struct.unpack("<I", fmt[8:12])
+            if chunk_size % 2:
+                f.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            # Streamed writers leave a 0 / 0xFFFFFFFF placeholder size; let ``wave`` handle those.
+            if byte_rate == 0 or chunk_size in (0, 0xFFFFFFFF):
+                return None
+            return f.tell(), chunk_size, byte_rate
+        else:
+            f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+
+
+def _wav_duration_fast(wav_path: Path) -> Optional[float]:
+    """Read the duration from the RIFF ``fmt `` and ``data`` headers, or None if they are unusual."""
+    with open(wav_path, "rb") as f:
+        data_chunk = _find_wav_data_chunk(f)
+    if data_chunk is None:
+        return None
+    _, data_size, byte_rate = data_chunk
+    return data_size / float(byte_rate)
 
 
 def get_wav_duration_seconds(wav_path: Path) -> float:
     """Compute the duration of a wav file in seconds."""
-    import wave
+    duration = _wav_duration_fast(wav_path)
+    if duration is not None:
+        return duration
 
     with contextlib.closing(wave.open(str(wav_path), "rb")) as wf:
         n_frames = wf.getnframes()
@@ -221,35 +327,365 @@ def get_wav_duration_seconds(wav_path: Path) -> float:
         return n_frames / float(framerate)
 
 
-def split_wav(input_wav: Path, chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC) -> tuple[list[Path], Path]:
-    """Split a wav file into chunks, returning chunk paths and the temp directory."""
-    duration = get_wav_duration_seconds(input_wav)
-    chunks_needed = max(1, math.ceil(duration / chunk_length_sec))
-    temp_dir = Path(tempfile.mkdtemp(prefix="audio_notes_chunks_"))
-    chunk_paths: list[Path] = []
+def load_pcm16_mono(wav_path: Path) -> Optional[np.ndarray]:
+    """Decode a 16 kHz mono 16-bit wav into float32 samples, or None if it has another layout."""
     try:
-        for i in range(chunks_needed):
-            start = i * chunk_length_sec
-            out_path = temp_dir / f"chunk_{i:03d}.wav"
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(input_wav),
-                "-ss",
-                str(start),
-                "-t",
-                str(chunk_length_sec),
-                "-acodec",
-                "copy",
-                str(out_path),
-            ]
-            subprocess.run(cmd, check=True)
-            chunk_paths.append(out_path)
-    except Exception:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-        raise
-    return chunk_paths, temp_dir
+        wf = wave.open(str(wav_path), "rb")
+    except wave.Error:
+        # Float, ADPCM and other non-PCM payloads are left to NeMo's own loader.
+        return None
+    with contextlib.closing(wf):
+        if wf.getframerate() != MODEL_SAMPLE_RATE or wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+            return None
+        frames = wf.readframes(wf.getnframes())
+    return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+
+
+@functools.lru_cache(maxsize=1)
+def get_transcriber() -> CanaryTranscriber:
+    """Return the process-wide transcriber, loading the model on first use only."""
+    # No arguments: a second cache key would silently evict a loaded model without close().
+    return CanaryTranscriber()
+
+
+def _load_batch_waveforms(chunks: list[Union[Path, np.ndarray]]) -> Optional[list[np.ndarray]]:
+    """Decode every chunk of a batch, or None if any needs NeMo's own loader."""
+    waveforms: list[np.ndarray] = []
+    for chunk in chunks:
+        waveform = chunk if isinstance(chunk, np.ndarray) else load_pcm16_mono(chunk)
+        if waveform is None:
+            return None
+        waveforms.append(waveform)
+    return waveforms
+
+
+def _ffmpeg_command(*args: str, loglevel: str = FFMPEG_LOGLEVEL) -> list[str]:
+    """Build a non-interactive ffmpeg command that overwrites outputs and uses every core."""
+    return [
+        _FFMPEG,
+        "-nostdin",
+        "-hide_banner",
+        "-nostats",
+        "-loglevel",
+        loglevel,
+        "-threads",
+        "0",
+        "-y",
+        *args,
+    ]
+
+
+def _segment_audio(
+    input_path: Path,
+    temp_dir: Path,
+    chunk_length_sec: int,
+    codec_args: list[str],
+) -> list[Path]:
+    """Run one ffmpeg segment-muxer pass into ``temp_dir``, returning the chunk paths."""
+    cmd = _ffmpeg_command(
+        "-i",
+        os.fspath(input_path),
+        *codec_args,
+        "-f",
+        "segment",
+        "-segment_time",
+        str(chunk_length_sec),
+        "-reset_timestamps",
+        "1",
+        os.fspath(temp_dir / "chunk_%03d.wav"),
+    )
+    subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
+    chunk_paths = sorted(temp_dir.glob("chunk_*.wav"))
+    if not chunk_paths:
+        raise RuntimeError(f"ffmpeg produced no chunks for {input_path}")
+    return chunk_paths
+
+
+def iter_split_wav(
+    input_wav: Path,
+    temp_dir: Path,
+    chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    *,
+    spans: Optional[list[tuple[float, float]]] = None,
+) -> Iterator[Path]:
+    """Yield wav chunks written to ``temp_dir``, each one as soon as it is on disk.
+
+    Without ``spans`` the file is cut on a fixed ``chunk_length_sec`` grid; otherwise each
+    ``(start, end)`` span in seconds becomes one chunk.
+    """
+    try:
+        wf = wave.open(str(input_wav), "rb")
+    except wave.Error:
+        # Non-PCM wav payloads (float, ADPCM, ...) go through one ffmpeg segment-muxer pass instead.
+        yield from _segment_audio(input_wav, temp_dir, chunk_length_sec, ["-c", "copy"])
+        return
+
+    # PCM is cut without subprocesses. When the data chunk can be located, chunks are written
+    # straight from a read-only mmap of the source instead of copying frames into new bytes.
+    with contextlib.closing(wf):
+        params = wf.getparams()
+        frame_bytes = params.nchannels * params.sampwidth
+        with open(input_wav, "rb") as f:
+            data_chunk = _find_wav_data_chunk(f)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if data_chunk else None
+        pcm: Optional[memoryview] = None
+        try:
+            if mapped is not None and data_chunk is not None:
+                data_offset, data_size, _ = data_chunk
+                # Slicing clamps to the mapping, so a truncated recording yields only the data present.
+                pcm = memoryview(mapped)[data_offset : data_offset + data_size]
+            total_frames = len(pcm) // frame_bytes if pcm is not None else params.nframes
+            if spans is None:
+                frames_per_chunk = max(1, int(chunk_length_sec * params.framerate))
+                frame_ranges: Iterable[tuple[int, int]] = (
+                    (start, frames_per_chunk) for start in range(0, total_frames, frames_per_chunk)
+                )
+            else:
+                frame_ranges = (
+                    (int(start * params.framerate), int((end - start) * params.framerate)) for start, end in spans
+                )
+            index = 0
+            for start_frame, frame_count in frame_ranges:
+                if start_frame >= total_frames:
+                    break
+                if pcm is not None:
+                    data = pcm[start_frame * frame_bytes : (start_frame + frame_count) * frame_bytes]
+                else:
+                    if wf.tell() != start_frame:
+                        wf.setpos(start_frame)
+                    data = wf.readframes(frame_count)
+                try:
+                    # A span that rounds to no frames is skipped; later spans still get cut.
+                    if not len(data):
+                        continue
+                    out_path = temp_dir / f"chunk_{index:03d}.wav"
+                    with contextlib.closing(wave.open(str(out_path), "wb")) as out:
+                        out.setparams(params)
+                        # Exact frame count up front, so the header never needs patching on close.
+                        out.setnframes(len(data) // frame_bytes)
+                        out.writeframesraw(data)
+                finally:
+                    if isinstance(data, memoryview):
+                        data.release()
+                index += 1
+                yield out_path
+        finally:
+            if pcm is not None:
+                pcm.release()
+            if mapped is not None:
+                mapped.close()
+
+
+def detect_silences(input_path: Path, *, transcode_to: Optional[Path] = None) -> list[tuple[float, float]]:
+    """Return ``(start, end)`` silent ranges found by ffmpeg's silencedetect filter.
+
+    When ``transcode_to`` is given, the same ffmpeg pass also writes a 16 kHz mono wav there.
+    """
+    # silencedetect reports at info level, so this pass cannot use the quieter default loglevel.
+    cmd = _ffmpeg_command(
+        "-i",
+        os.fspath(input_path),
+        "-af",
+        f"silencedetect=noise={VAD_NOISE_DB}dB:d={VAD_MIN_SILENCE_SEC}",
+        loglevel="info",
+    )
+    if transcode_to is None:
+        cmd += ["-f", "null", "-"]
+    else:
+        cmd += ["-ar", str(MODEL_SAMPLE_RATE), "-ac", "1", os.fspath(transcode_to)]
+    result = subprocess.run(
+        cmd,
+        check=True,
+        stdin=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    )
+
+    silences: list[tuple[float, float]] = []
+    silence_start: Optional[float] = None
+    for kind, value in _SILENCE_RE.findall(result.stderr):
+        if kind == "start":
+            silence_start = max(0.0, float(value))
+        elif silence_start is not None:
+            silences.append((silence_start, float(value)))
+            silence_start = None
+    if silence_start is not None:
+        silences.append((silence_start, math.inf))
+    return silences
+
+
+def plan_vad_chunks(
+    silences: list[tuple[float, float]],
+    duration: float,
+    chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+) -> list[tuple[float, float]]:
+    """Greedily pack the voiced gaps between ``silences`` into spans of at most ``chunk_length_sec``.
+
+    Silence between spans is dropped, and cuts land inside silences whenever a voiced region fits;
+    only voiced regions longer than ``chunk_length_sec`` are cut mid-speech.
+    """
+    voiced: list[tuple[float, float]] = []
+    cursor = 0.0
+    for start, end in sorted(silences):
+        if start > cursor:
+            voiced.append((cursor, min(start, duration)))
+        cursor = max(cursor, end)
+    if cursor < duration:
+        voiced.append((cursor, duration))
+
+    spans: list[tuple[float, float]] = []
+    for start, end in voiced:
+        if spans and end - spans[-1][0] <= chunk_length_sec:
+            spans[-1] = (spans[-1][0], end)
+            continue
+        while end - start > chunk_length_sec:
+            spans.append((start, start + chunk_length_sec))
+            start += chunk_length_sec
+        if end > start:
+            spans.append((start, end))
+    return spans
+
+
+def iter_decoded_chunks(input_path: Path, chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC) -> Iterator[np.ndarray]:
+    """Decode any input to 16 kHz mono through an ffmpeg pipe, yielding one waveform per chunk."""
+    cmd = _ffmpeg_command(
+        "-i",
+        os.fspath(input_path),
+        "-ar",
+        str(MODEL_SAMPLE_RATE),
+        "-ac",
+        "1",
+        "-f",
+        "s16le",
+        "pipe:1",
+    )
+    chunk_bytes = chunk_length_sec * MODEL_SAMPLE_RATE * 2
+    # Nothing touches the disk: PCM is read off stdout one chunk at a time, so memory stays
+    # bounded by the chunk length rather than the recording length.
+    # stderr goes to a temp file: a damaged input can log an error per frame, which would fill a
+    # pipe nobody is reading yet and stall ffmpeg's stdout along with it.
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            while True:
+                data = proc.stdout.read(chunk_bytes)
+                if len(data) < 2:
+                    break
+                pcm = np.frombuffer(data, dtype="<i2", count=len(data) // 2)
+                yield pcm.astype(np.float32) / 32768.0
+            if proc.wait() != 0:
+                stderr_file.seek(0)
+                # Only the tail: a damaged file can repeat the same error thousands of times.
+                message = "\n".join(stderr_file.read().decode("utf-8", "replace").strip().splitlines()[-10:])
+                raise RuntimeError(f"ffmpeg failed to decode {input_path}: {message or proc.returncode}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+
+def _transcribe_chunks(
+    chunks: Iterable[Union[Path, np.ndarray]],
+    total: int,
+    *,
+    transcriber: CanaryTranscriber,
+    batch_size: int,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> list[str]:
+    """Transcribe chunks in batches while a producer thread keeps splitting and decoding ahead."""
+    batch_size = max(1, batch_size)
+    # Bounded so the producer never runs more than a couple of batches ahead of the GPU.
+    ready: queue.Queue = queue.Queue(maxsize=2)
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            batch: list[Union[Path, np.ndarray]] = []
+            for chunk in chunks:
+                batch.append(chunk)
+                if len(batch) == batch_size:
+                    if not _put((batch, _load_batch_waveforms(batch))):
+                        return
+                    batch = []
+            if batch and not _put((batch, _load_batch_waveforms(batch))):
+                return
+        except BaseException as exc:
+            _put(exc)
+            return
+        _put(None)
+
+    producer = threading.Thread(target=_produce, name="audio-notes-chunker", daemon=True)
+    producer.start()
+    texts: list[str] = []
+    try:
+        while True:
+            item = ready.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            batch, waveforms = item
+            done = len(texts) + len(batch)
+            of_total = f"/{max(total, done)}" if total else ""
+            print(f"Transcribing chunks {len(texts) + 1}-{done}{of_total}...")
+            if waveforms is None:
+                texts.extend(transcriber.transcribe_paths(batch))
+            else:
+                texts.extend(transcriber.transcribe_waveforms(waveforms))
+            if progress_callback is not None:
+                progress_callback(len(texts), total)
+    finally:
+        stop.set()
+        producer.join()
+        # Close a half-consumed chunk generator now; a stored exception's traceback would
+        # otherwise keep it (and any ffmpeg process feeding it) alive.
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+    if not texts:
+        raise RuntimeError("No audio chunks were produced for transcription")
+    return texts
+
+
+def _dedupe_repeats(text: str) -> tuple[str, int]:
+    """Collapse runs of the same n-gram repeated back to back, returning the text and tokens dropped.
+
+    ASR models loop on a phrase during silence or music; one copy keeps the meaning.
+    """
+    n, min_run = REPEAT_NGRAM, REPEAT_MIN_RUN
+    lines: list[str] = []
+    elided = 0
+    for line in text.split("\n"):
+        tokens = line.split()
+        kept: list[str] = []
+        line_elided = 0
+        i = 0
+        while i < len(tokens):
+            gram = tokens[i : i + n]
+            run = 1
+            while len(gram) == n and tokens[i + run * n : i + (run + 1) * n] == gram:
+                run += 1
+            if run >= min_run:
+                kept.extend(gram)
+                line_elided += (run - 1) * n
+                i += run * n
+            else:
+                kept.append(tokens[i])
+                i += 1
+        lines.append(" ".join(kept) if line_elided else line)
+        elided += line_elided
+    return "\n".join(lines), elided
 
 
 def transcribe_audio(
@@ -257,94 +693,165 @@ def transcribe_audio(
     *,
     transcriber: CanaryTranscriber,
     chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
+    progress_callback: Optional[ProgressCallback] = None,
 ) -> str:
-    """Transcribe audio using Canary-Qwen, chunking longer files automatically."""
-    try:
-        duration = get_wav_duration_seconds(audio_path)
-    except Exception:
-        print("Transcribing audio file...")
-        return transcriber.transcribe(audio_path)
+    """Transcribe audio using Canary-Qwen, dropping runaway phrase repeats from the result."""
+    transcription = _transcribe_raw(
+        audio_path,
+        transcriber=transcriber,
+        chunk_length_sec=chunk_length_sec,
+        batch_size=batch_size,
+        split_mode=split_mode,
+        progress_callback=progress_callback,
+    )
+    transcription, elided = _dedupe_repeats(transcription)
+    if elided:
+        print(f"Removed {elided} repeated token(s) from the transcription.")
+    return transcription
 
-    if duration <= chunk_length_sec:
-        print("Transcribing audio file...")
-        return transcriber.transcribe(audio_path)
 
-    print(f"File is long ({duration:.1f}s), splitting into chunks...")
-    chunk_paths, temp_dir = split_wav(audio_path, chunk_length_sec)
-    texts: list[str] = []
+def _transcribe_raw(
+    audio_path: Path,
+    *,
+    transcriber: CanaryTranscriber,
+    chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> str:
+    """Transcribe audio using Canary-Qwen, chunking longer files automatically."""
+    if split_mode not in SPLIT_MODES:
+        raise ValueError(f"Unsupported split mode: {split_mode}")
+    is_wav = audio_path.suffix.lower() == ".wav"
+    if is_wav:
+        try:
+            duration: Optional[float] = get_wav_duration_seconds(audio_path)
+        except Exception:
+            duration = None
+
+        if duration is None or duration <= chunk_length_sec:
+            print("Transcribing audio file...")
+            text = transcriber.transcribe(audio_path)
+            if progress_callback is not None:
+                progress_callback(1, 1)
+            return text
+
+        print(f"File is long ({duration:.1f}s), splitting into chunks...")
+    else:
+        # Other containers are decoded once by ffmpeg and chunked in memory as they stream in.
+        print("Decoding audio to 16 kHz mono chunks...")
+
+    SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
+    temp_dir = Path(tempfile.mkdtemp(prefix="chunks_", dir=SCRATCH_DIR))
     try:
-        for idx, chunk in enumerate(chunk_paths, start=1):
-            print(f"Transcribing chunk {idx}/{len(chunk_paths)}...")
-            texts.append(transcriber.transcribe(chunk))
+        if split_mode == "vad":
+            # Silence detection rides along with the transcode for non-wav inputs.
+            source_wav = audio_path if is_wav else temp_dir / "source.wav"
+            silences = detect_silences(audio_path, transcode_to=None if is_wav else source_wav)
+            if not is_wav:
+                # A wav input's header was already read above; only the fresh transcode needs it.
+                duration = get_wav_duration_seconds(source_wav)
+            spans = plan_vad_chunks(silences, duration, chunk_length_sec) or None
+            if spans is not None:
+                voiced = sum(end - start for start, end in spans)
+                print(f"Voice activity: {voiced:.1f}s of {duration:.1f}s in {len(spans)} chunk(s).")
+            chunks: Iterable[Union[Path, np.ndarray]] = iter_split_wav(source_wav, temp_dir, chunk_length_sec, spans=spans)
+            total = len(spans) if spans is not None else max(1, math.ceil(duration / chunk_length_sec))
+        elif is_wav:
+            # Chunks stream out as they are cut, so the first batch transcribes while the rest split.
+            chunks = iter_split_wav(audio_path, temp_dir, chunk_length_sec)
+            total = max(1, math.ceil(duration / chunk_length_sec))
+        else:
+            # The duration is unknown until the stream ends, so progress is reported without a total.
+            chunks = iter_decoded_chunks(audio_path, chunk_length_sec)
+            total = 0
+        texts = _transcribe_chunks(
+            chunks,
+            total,
+            transcriber=transcriber,
+            batch_size=batch_size,
+            progress_callback=progress_callback,
+        )
     finally:
         shutil.rmtree(temp_dir, ignore_errors=True)
     return "\n".join(texts)
 
 
-def generate_notes(transcription: str, api_key: str) -> str:
-    client = openai.OpenAI(api_key=api_key)
-    response = client.chat.completions.create(
-        model="gpt-5.1",
-        messages = [
-    {
-        "role": "system",
-        "content": (
-            "ROLE\n"
-            "You are an expert meeting-notes synthesizer.\n\n"
-            "OBJECTIVE\n"
-            "Convert the provided raw meeting transcript into a single, clean set of notes that follow the exact plain-text template below, regardless of meeting type.\n\n"
-            "GLOBAL RULES\n"
-            "- Use plain text only. Do not use any markdown (no #, *, _, tables, or emojis).\n"
-            "- Replace every instance of the name \"Zane\" with \"Zain\" everywhere (speakers, attendees, tasks, quotes).\n"
-            "- Do not invent facts. If information is missing, write \"Not stated\".\n"
-            "- Keep names as they appear (after the Zane→Zain replacement). Do not infer last names unless present.\n"
-            "- Normalize dates to MM-DD-YYYY and times to 12-hour HH:MM AM/PM. Include timezone if present in the transcript.\n"
-            "- Convert relative dates (e.g., \"next Friday\") to exact dates only if the transcript provides a reference date; otherwise keep the relative phrase.\n"
-            "- Be concise and specific. Remove filler and repetition. One idea per bullet.\n"
-            "- De-duplicate repeated points and action items; keep the most complete version.\n"
-            "- If timestamps exist, attach the most relevant timestamp to each action item.\n\n"
-            "OUTPUT TEMPLATE (copy these headings exactly; fill every field; use \"Not stated\" if unknown)\n\n"
-            "MEETING NOTES\n"
-            "TITLE:\n"
-            "DATE:\n\n"
-            "EXECUTIVE SUMMARY: - 3-6 bullet points\n"
-            "- \n"
-            "- \n"
-            "- \n"
-            "- \n\n"
-            "AGENDA & COVERAGE:\n"
-            "- Item 1: Covered / Partially Covered / Skipped — 1–2 sentence summary\n"
-            "- Item 2: ...\n"
-            "- Additional items: ...\n\n"
-            "KEY DISCUSSION POINTS (GROUPED BY TOPIC):\n"
-            "- Topic: 2–4 sentence summary\n"
-            "  - Notable details:\n"
-            "  - Metrics/dates mentioned:\n"
-            "  - Dependencies:\n\n"
-            "DECISIONS MADE:\n"
-            "- Decision: Rationale — Owner — Effective date\n\n"
-            "RISKS / BLOCKERS:\n"
-            "- Risk: Impact — Mitigation — Owner\n\n"
-            "OPEN QUESTIONS:\n"
-            "- Question — Owner — Needed by (YYYY-MM-DD)\n\n"
-            "FOLLOW-UPS / NEXT STEPS:\n"
-            "- Next step — Owner — Target date\n\n"
-            "PARKING LOT:\n"
-            "- Item to revisit\n\n"
-            "QUALITY CHECKS (perform silently; do not include this section in the output)\n"
-            "1) All \"Zane\" → \"Zain\".\n"
-            "2) No markdown characters used.\n"
-            "3) All headings present and in the same order.\n"
-            "4) \"Not stated\" used where information is missing.\n"
-            "5) Duplicates merged; owners and due dates standardized.\n"
-        ),
-    },
-    {"role": "user", "content": transcription},
-]
+_SYSTEM_PROMPT: str = (
+    "ROLE\n"
+    "You are an expert meeting-notes synthesizer.\n\n"
+    "OBJECTIVE\n"
+    "Convert the provided raw meeting transcript into a single, clean set of notes that follow the exact plain-text template below, regardless of meeting type.\n\n"
+    "GLOBAL RULES\n"
+    "- Use plain text only. Do not use any markdown (no #, *, _, tables, or emojis).\n"
+    "- Replace every instance of the name \"Zane\" with \"Zain\" everywhere (speakers, attendees, tasks, quotes).\n"
+    "- Do not invent facts. If information is missing, write \"Not stated\".\n"
+    "- Keep names as they appear (after the Zane→Zain replacement). Do not infer last names unless present.\n"
+    "- Normalize dates to MM-DD-YYYY and times to 12-hour HH:MM AM/PM. Include timezone if present in the transcript.\n"
+    "- Convert relative dates (e.g., \"next Friday\") to exact dates only if the transcript provides a reference date; otherwise keep the relative phrase.\n"
+    "- Be concise and specific. Remove filler and repetition. One idea per bullet.\n"
+    "- De-duplicate repeated points and action items; keep the most complete version.\n"
+    "- If timestamps exist, attach the most relevant timestamp to each action item.\n\n"
+    "OUTPUT TEMPLATE (copy these headings exactly; fill every field; use \"Not stated\" if unknown)\n\n"
+    "MEETING NOTES\n"
+    "TITLE:\n"
+    "DATE:\n\n"
+    "EXECUTIVE SUMMARY: - 3-6 bullet points\n"
+    "- \n"
+    "- \n"
+    "- \n"
+    "- \n\n"
+    "AGENDA & COVERAGE:\n"
+    "- Item 1: Covered / Partially Covered / Skipped — 1–2 sentence summary\n"
+    "- Item 2: ...\n"
+    "- Additional items: ...\n\n"
+    "KEY DISCUSSION POINTS (GROUPED BY TOPIC):\n"
+    "- Topic: 2–4 sentence summary\n"
+    "  - Notable details:\n"
+    "  - Metrics/dates mentioned:\n"
+    "  - Dependencies:\n\n"
+    "DECISIONS MADE:\n"
+    "- Decision: Rationale — Owner — Effective date\n\n"
+    "RISKS / BLOCKERS:\n"
+    "- Risk: Impact — Mitigation — Owner\n\n"
+    "OPEN QUESTIONS:\n"
+    "- Question — Owner — Needed by (YYYY-MM-DD)\n\n"
+    "FOLLOW-UPS / NEXT STEPS:\n"
+    "- Next step — Owner — Target date\n\n"
+    "PARKING LOT:\n"
+    "- Item to revisit\n\n"
+    "QUALITY CHECKS (perform silently; do not include this section in the output)\n"
+    "1) All \"Zane\" → \"Zain\".\n"
+    "2) No markdown characters used.\n"
+    "3) All headings present and in the same order.\n"
+    "4) \"Not stated\" used where information is missing.\n"
+    "5) Duplicates merged; owners and due dates standardized.\n"
+)
+_SYSTEM_MESSAGE: dict[str, str] = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(api_key: str) -> openai.OpenAI:
+    """Share one client (and its HTTP connection pool) across note requests and worker threads."""
+    return openai.OpenAI(api_key=api_key)
 
+
+def stream_notes(transcription: str, api_key: str) -> Iterator[str]:
+    """Yield the generated notes piece by piece as the completion streams in."""
+    client = _get_openai_client(api_key)
+    stream = client.chat.completions.create(
+        model="gpt-5.1",
+        messages=[_SYSTEM_MESSAGE, {"role": "user", "content": transcription}],
+        stream=True,
     )
-    content = response.choices[0].message.content
-    return content if content else "No notes generated."
+    for event in stream:
+        if not event.choices:
+            continue
+        delta = event.choices[0].delta.content
+        if delta:
+            yield delta
 
 
 def ensure_api_key(api_key: Optional[str]) -> str:
@@ -355,68 +862,281 @@ def ensure_api_key(api_key: Optional[str]) -> str:
     return key
 
 
+@contextlib.contextmanager
+def _atomic_writer(path: Path) -> Iterator[TextIO]:
+    """Open a buffered temp file that is renamed onto ``path`` only once writing succeeds."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _atomic_write_text(path: Path, data: str) -> None:
+    """Write ``data`` in one buffered pass, then rename so readers never see a partial file."""
+    with _atomic_writer(path) as f:
+        f.write(data)
+
+
 def find_existing_outputs(output_dir: Path, base_title: str) -> tuple[list[Path], list[Path]]:
     trans_files = sorted(output_dir.glob(f"{base_title}_*-transcription.txt"))
     notes_files = sorted(output_dir.glob(f"{base_title}_*-notes.txt"))
     return trans_files, notes_files
 
 
-def process_file(
+def index_output_name(existing_outputs: dict[str, set[str]], name: str) -> None:
+    """Record ``name`` in ``existing_outputs`` (base title -> output kinds) if it is a generated output."""
+    match = _OUTPUT_NAME_RE.match(name)
+    if match:
+        existing_outputs.setdefault(match.group("base"), set()).add(match.group("kind"))
+
+
+def has_existing_outputs(
+    input_path: Path,
+    existing_outputs: Optional[dict[str, set[str]]] = None,
+    existing_outputs_dir: Optional[Path] = None,
+) -> bool:
+    """Whether the resolved ``input_path`` already has a transcription and notes beside it.
+
+    ``existing_outputs`` only describes ``existing_outputs_dir``; files living anywhere else (a
+    symlink's target, say) are checked with a glob of their own folder.
+    """
+    if existing_outputs is not None and input_path.parent == existing_outputs_dir:
+        return existing_outputs.get(input_path.stem, set()) >= _OUTPUT_KINDS
+    trans_files, notes_files = find_existing_outputs(input_path.parent, input_path.stem)
+    return bool(trans_files and notes_files)
+
+
+def transcribe_file(
     input_path: Path,
-    api_key: str,
     *,
     chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
     skip_existing: bool = False,
     transcriber: Optional[CanaryTranscriber] = None,
-) -> Optional[dict[str, Path]]:
+    existing_outputs: Optional[dict[str, set[str]]] = None,
+    existing_outputs_dir: Optional[Path] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> Optional[tuple[str, dict[str, Path]]]:
+    """Transcribe one file and write its transcript, returning the text and planned output paths."""
     input_path = Path(input_path).expanduser().resolve()
-    if not input_path.exists() or not input_path.is_file():
+    if not input_path.is_file():
         raise FileNotFoundError(f"Audio file not found: {input_path}")
 
-    if input_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+    if input_path.suffix.lower() not in _SUPPORTED_EXTENSION_SET:
         raise ValueError(f"Unsupported file type: {input_path.suffix}")
 
     output_dir = input_path.parent
     base_title = input_path.stem
-    trans_files, notes_files = find_existing_outputs(output_dir, base_title)
-    if skip_existing and trans_files and notes_files:
-        print(f"Skipping {input_path.name}: existing transcription and notes detected.")
-        return None
+    if skip_existing:
+        if has_existing_outputs(input_path, existing_outputs, existing_outputs_dir):
+            print(f"Skipping {input_path.name}: existing transcription and notes detected.")
+            return None
 
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     transcription_path = output_dir / f"{base_title}_{timestamp}-transcription.txt"
     notes_path = output_dir / f"{base_title}_{timestamp}-notes.txt"
 
     print(f"Processing: {input_path}")
-    wav_path, should_cleanup_wav = convert_to_wav(input_path)
 
-    close_transcriber = False
-    if transcriber is None:
-        transcriber = CanaryTranscriber()
-        close_transcriber = True
+    transcription = transcribe_audio(
+        input_path,
+        transcriber=transcriber or get_transcriber(),
+        chunk_length_sec=chunk_length_sec,
+        batch_size=batch_size,
+        split_mode=split_mode,
+        progress_callback=progress_callback,
+    )
+
+    _atomic_write_text(transcription_path, transcription)
+    print(f"  -> {transcription_path}")
+
+    return transcription, {"transcription_path": transcription_path, "notes_path": notes_path}
+
+
+def write_notes(transcription: str, notes_path: Path, api_key: str) -> Path:
+    """Generate notes for a transcript and write them to ``notes_path``."""
+    # Deltas go straight to the temp file instead of accumulating the full response in memory.
+    with _atomic_writer(notes_path) as f:
+        wrote_any = False
+        for delta in stream_notes(transcription, api_key):
+            f.write(delta)
+            wrote_any = True
+        if not wrote_any:
+            f.write("No notes generated.")
+    print(f"  -> {notes_path}")
+    return notes_path
+
+
+def process_file(
+    input_path: Path,
+    api_key: str,
+    *,
+    chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
+    skip_existing: bool = False,
+    transcriber: Optional[CanaryTranscriber] = None,
+    existing_outputs: Optional[dict[str, set[str]]] = None,
+    existing_outputs_dir: Optional[Path] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+) -> Optional[dict[str, Path]]:
+    transcribed = transcribe_file(
+        input_path,
+        chunk_length_sec=chunk_length_sec,
+        batch_size=batch_size,
+        split_mode=split_mode,
+        skip_existing=skip_existing,
+        transcriber=transcriber,
+        existing_outputs=existing_outputs,
+        existing_outputs_dir=existing_outputs_dir,
+        progress_callback=progress_callback,
+    )
+    if transcribed is None:
+        return None
+
+    transcription, outputs = transcribed
+    write_notes(transcription, outputs["notes_path"], api_key)
+    return outputs
+
 
+def _gpu_worker(
+    device: str,
+    file_queue,
+    result_queue,
+    api_key: str,
+    options: dict,
+) -> None:
+    """Process files from ``file_queue`` with a transcriber pinned to ``device`` until a None sentinel."""
+    transcriber = CanaryTranscriber(device=device)
     try:
-        transcription = transcribe_audio(
-            wav_path,
-            transcriber=transcriber,
-            chunk_length_sec=chunk_length_sec,
-        )
+        while True:
+            audio_file = file_queue.get()
+            if audio_file is None:
+                break
+            try:
+                result = process_file(audio_file, api_key, transcriber=transcriber, **options)
+                result_queue.put((audio_file, result is not None, None))
+            except Exception as exc:
+                result_queue.put((audio_file, False, str(exc)))
     finally:
-        if should_cleanup_wav and wav_path.exists():
-            wav_path.unlink()
-        if close_transcriber:
-            transcriber.close()
+        transcriber.close()
 
-    with open(transcription_path, "w", encoding="utf-8") as f:
-        f.write(transcription)
-    print(f"  -> {transcription_path}")
 
-    notes = generate_notes(transcription, api_key)
-    with open(notes_path, "w", encoding="utf-8") as f:
-        f.write(notes)
-    print(f"  -> {notes_path}")
+def _process_files_on_gpus(
+    audio_files: list[Path],
+    api_key: str,
+    *,
+    num_workers: int,
+    chunk_length_sec: int,
+    batch_size: int,
+    split_mode: str,
+) -> bool:
+    """Fan files out to one spawned worker process per GPU, each holding its own model copy."""
+    print(f"Distributing {len(audio_files)} file(s) across {num_workers} GPU worker(s)...")
+    mp_context = torch.multiprocessing.get_context("spawn")
+    file_queue = mp_context.Queue()
+    result_queue = mp_context.Queue()
+    for audio_file in audio_files:
+        file_queue.put(audio_file)
+    for _ in range(num_workers):
+        file_queue.put(None)
+
+    options = {"chunk_length_sec": chunk_length_sec, "batch_size": batch_size, "split_mode": split_mode}
+    workers = [
+        mp_context.Process(
+            target=_gpu_worker,
+            args=(f"cuda:{index}", file_queue, result_queue, api_key, options),
+            daemon=True,
+        )
+        for index in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    processed_any = False
+    remaining = len(audio_files)
+    try:
+        while remaining:
+            try:
+                audio_file, processed, error = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    print(f"GPU workers exited with {remaining} file(s) unprocessed.")
+                    break
+                continue
+            remaining -= 1
+            if error is not None:
+                print(f"Error processing {audio_file.name}: {error}")
+            elif processed:
+                processed_any = True
+    finally:
+        for worker in workers:
+            worker.join()
+    return processed_any
+
 
-    return {"transcription_path": transcription_path, "notes_path": notes_path}
+def process_files(
+    audio_files: list[Path],
+    api_key: str,
+    *,
+    chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
+    skip_existing: bool = False,
+    transcriber: Optional[CanaryTranscriber] = None,
+    existing_outputs: Optional[dict[str, set[str]]] = None,
+    existing_outputs_dir: Optional[Path] = None,
+    progress_callback: Optional[Callable[[int, int, int], None]] = None,
+) -> list[tuple[Path, Union[dict[str, Path], Exception, None]]]:
+    """Process several files in one process, returning each file's outputs, None if skipped, or its error.
+
+    ``progress_callback`` receives the file's index followed by the usual ``ProgressCallback`` arguments.
+    """
+    outcomes: list[Union[dict[str, Path], Exception, None]] = [None] * len(audio_files)
+    # Transcription stays on this thread (the GPU is serialized); note generation is
+    # network-bound, so it runs in the background while the next file is transcribed.
+    # The shared transcriber is only loaded once a file actually needs transcribing.
+    pending_notes: dict[Future[Path], tuple[int, dict[str, Path]]] = {}
+    with ThreadPoolExecutor(max_workers=NOTES_MAX_WORKERS) as notes_pool:
+        for index, audio_file in enumerate(audio_files):
+            try:
+                transcribed = transcribe_file(
+                    audio_file,
+                    chunk_length_sec=chunk_length_sec,
+                    batch_size=batch_size,
+                    split_mode=split_mode,
+                    skip_existing=skip_existing,
+                    transcriber=transcriber,
+                    existing_outputs=existing_outputs,
+                    existing_outputs_dir=existing_outputs_dir,
+                    progress_callback=(
+                        functools.partial(progress_callback, index) if progress_callback is not None else None
+                    ),
+                )
+            except Exception as exc:
+                print(f"Error processing {audio_file.name}: {exc}")
+                outcomes[index] = exc
+                continue
+            if transcribed is None:
+                continue
+            transcription, outputs = transcribed
+            future = notes_pool.submit(write_notes, transcription, outputs["notes_path"], api_key)
+            pending_notes[future] = (index, outputs)
+
+        for future in as_completed(pending_notes):
+            index, outputs = pending_notes[future]
+            try:
+                future.result()
+                outcomes[index] = outputs
+            except Exception as exc:
+                print(f"Error processing {audio_files[index].name}: {exc}")
+                outcomes[index] = exc
+    return list(zip(audio_files, outcomes))
 
 
 def process_all_in_folder(
@@ -424,40 +1144,90 @@ def process_all_in_folder(
     api_key: str,
     *,
     chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
     skip_existing: bool = True,
+    transcriber: Optional[CanaryTranscriber] = None,
+    gpu_workers: bool = True,
 ) -> bool:
     input_folder = Path(input_folder).expanduser().resolve()
-    if not input_folder.exists() or not input_folder.is_dir():
+    if not input_folder.is_dir():
         raise NotADirectoryError(f"Folder not found: {input_folder}")
 
-    audio_files = [
-        f
-        for f in input_folder.iterdir()
-        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS and not f.name.endswith(".converted.wav")
-    ]
+    # One directory read finds both the candidate audio files and their existing outputs;
+    # DirEntry carries the file type, so no per-entry stat or per-file glob is needed.
+    audio_files: list[Path] = []
+    existing_outputs: dict[str, set[str]] = {}
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if os.path.splitext(name)[1].lower() in _SUPPORTED_EXTENSION_SET:
+                if not name.endswith(".converted.wav") and entry.is_file():
+                    # A symlink's outputs land beside its target, so track it by the resolved path.
+                    audio_path = Path(entry.path)
+                    audio_files.append(audio_path.resolve() if entry.is_symlink() else audio_path)
+            elif name.endswith(".txt"):
+                index_output_name(existing_outputs, name)
     if not audio_files:
         return False
 
     print(f"Found {len(audio_files)} file(s) to check in {input_folder}")
-    transcriber = CanaryTranscriber()
-    processed_any = False
-    try:
+    # Workers each load their own model, so fan out only when this process holds none; a cached
+    # transcriber would otherwise share cuda:0 with a worker's copy.
+    fan_out = gpu_workers and transcriber is None and get_transcriber.cache_info().currsize == 0
+    gpu_count = torch.cuda.device_count() if fan_out else 0
+    if gpu_count > 1:
+        pending_files: list[Path] = []
         for audio_file in audio_files:
-            try:
-                result = process_file(
-                    audio_file,
-                    api_key,
-                    chunk_length_sec=chunk_length_sec,
-                    skip_existing=skip_existing,
-                    transcriber=transcriber,
-                )
-                if result is not None:
-                    processed_any = True
-            except Exception as exc:
-                print(f"Error processing {audio_file.name}: {exc}")
-    finally:
-        transcriber.close()
-    return processed_any
+            if skip_existing and has_existing_outputs(audio_file, existing_outputs, input_folder):
+                print(f"Skipping {audio_file.name}: existing transcription and notes detected.")
+            else:
+                pending_files.append(audio_file)
+        if len(pending_files) > 1:
+            return _process_files_on_gpus(
+                pending_files,
+                api_key,
+                num_workers=min(gpu_count, len(pending_files)),
+                chunk_length_sec=chunk_length_sec,
+                batch_size=batch_size,
+                split_mode=split_mode,
+            )
+        audio_files = pending_files
+
+    results = process_files(
+        audio_files,
+        api_key,
+        chunk_length_sec=chunk_length_sec,
+        batch_size=batch_size,
+        split_mode=split_mode,
+        skip_existing=skip_existing,
+        transcriber=transcriber,
+        existing_outputs=existing_outputs,
+        existing_outputs_dir=input_folder,
+    )
+    return any(isinstance(result, dict) for _, result in results)
+
+
+def _start_folder_watcher(folder: Path, wake: threading.Event):
+    """Set ``wake`` whenever a supported audio file appears in ``folder``; None without watchdog."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class _AudioDropHandler(FileSystemEventHandler):
+        def on_any_event(self, event) -> None:
+            if event.is_directory:
+                return
+            path = getattr(event, "dest_path", "") or event.src_path
+            if str(path).lower().endswith(SUPPORTED_EXTENSIONS):
+                wake.set()
+
+    observer = Observer()
+    observer.schedule(_AudioDropHandler(), str(folder), recursive=False)
+    observer.start()
+    return observer
 
 
 def run_processing_loop(
@@ -465,18 +1235,37 @@ def run_processing_loop(
     api_key: str,
     *,
     chunk_length_sec: int = DEFAULT_CHUNK_LENGTH_SEC,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    split_mode: str = DEFAULT_SPLIT_MODE,
     skip_existing: bool = True,
 ) -> None:
-    while True:
-        processed = process_all_in_folder(
-            folder,
-            api_key,
-            chunk_length_sec=chunk_length_sec,
-            skip_existing=skip_existing,
-        )
-        if not processed:
-            print("No more new files to process. Exiting.")
-            break
+    wake = threading.Event()
+    observer = _start_folder_watcher(folder, wake) if Path(folder).is_dir() else None
+    try:
+        while True:
+            wake.clear()
+            processed = process_all_in_folder(
+                folder,
+                api_key,
+                chunk_length_sec=chunk_length_sec,
+                batch_size=batch_size,
+                split_mode=split_mode,
+                skip_existing=skip_existing,
+                # Spawned workers would reload the model every sweep; the loop keeps one resident instead.
+                gpu_workers=False,
+            )
+            if not processed:
+                print("No more new files to process. Exiting.")
+                break
+            # Rescan right away if files landed during the pass, otherwise back off briefly.
+            if observer is None:
+                time.sleep(LOOP_IDLE_WAIT_SEC)
+            else:
+                wake.wait(timeout=LOOP_IDLE_WAIT_SEC)
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 
 def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
@@ -499,6 +1288,18 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
         default=DEFAULT_CHUNK_LENGTH_SEC,
         help=f"Chunk length in seconds when splitting long audio (default: {DEFAULT_CHUNK_LENGTH_SEC}).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Number of chunks transcribed per model call (default: {DEFAULT_BATCH_SIZE}).",
+    )
+    parser.add_argument(
+        "--split-mode",
+        choices=SPLIT_MODES,
+        default=DEFAULT_SPLIT_MODE,
+        help="How long audio is cut into chunks: a fixed grid, or at detected silences (default: fixed).",
+    )
     parser.add_argument(
         "--no-skip-existing",
         dest="skip_existing",
@@ -525,6 +1326,8 @@ def cli_main(argv: Optional[Iterable[str]] = None) -> None:
                 target,
                 api_key,
                 chunk_length_sec=args.chunk_length,
+                batch_size=args.batch_size,
+                split_mode=args.split_mode,
                 skip_existing=False,
             )
         elif target.is_dir():
@@ -532,6 +1335,8 @@ def cli_main(argv: Optional[Iterable[str]] = None) -> None:
                 target,
                 api_key,
                 chunk_length_sec=args.chunk_length,
+                batch_size=args.batch_size,
+                split_mode=args.split_mode,
                 skip_existing=args.skip_existing,
             )
             if not processed:
@@ -546,6 +1351,8 @@ def cli_main(argv: Optional[Iterable[str]] = None) -> None:
                 PROCESSING_FOLDER,
                 api_key,
                 chunk_length_sec=args.chunk_length,
+                batch_size=args.batch_size,
+                split_mode=args.split_mode,
                 skip_existing=args.skip_existing,
             )
         else:
@@ -553,6 +1360,8 @@ def cli_main(argv: Optional[Iterable[str]] = None) -> None:
                 PROCESSING_FOLDER,
                 api_key,
                 chunk_length_sec=args.chunk_length,
+                batch_size=args.batch_size,
+                split_mode=args.split_mode,
                 skip_existing=args.skip_existing,
             )
             if not processed:
@@ -1,44 +1,462 @@
 import argparse
+import contextlib
 import ctypes
+import functools
+import hashlib
+import json
+import os
 import sys
-import traceback
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional
-
-from app import (
-    DEFAULT_CHUNK_LENGTH_SEC,
-    ensure_api_key,
-    process_file,
-)
+from typing import Iterable, Optional, Union
 
 MB_ICONINFORMATION = 0x40
 MB_ICONERROR = 0x10
 MB_OK = 0x0
+_TITLE = "Create Notes"
+CLSID_TASKBAR_LIST = "{56FDF344-FD6D-11d0-958A-006097C9A090}"
+IID_ITASKBAR_LIST3 = "{EA1AFB91-9E28-4B86-90E9-9E9F8A5EEFAF}"
+CLSCTX_INPROC_SERVER = 0x1
+TBPF_NOPROGRESS = 0x0
+TBPF_INDETERMINATE = 0x1
+TBPF_NORMAL = 0x2
+CRED_TYPE_GENERIC = 0x1
+CREDENTIAL_TARGET = "OpenAI-Api-Key"  # Generic credential holding the OpenAI key in Credential Manager
+NIM_ADD = 0x0
+NIM_DELETE = 0x2
+NIF_ICON = 0x2
+NIF_TIP = 0x4
+NIF_INFO = 0x10
+NIIF_INFO = 0x1
+IDI_INFORMATION = 32516
+HWND_MESSAGE = -3
+NOTIFY_DISPLAY_SEC = 5.0  # How long the tray icon stays up so its balloon can be read
+CACHE_MAX_ENTRIES = 256  # Result-cache entries kept before the least recently used are evicted
+CACHE_LOCK_WAIT_SEC = 5.0  # Longest wait for another process's cache save; older locks count as stale
+
+FileResult = Union[dict[str, Path], Exception, None]
+
+
+@functools.lru_cache(maxsize=1)
+def _message_box_w():
+    """Resolve user32's MessageBoxW once, with an explicit signature so calls skip type guessing."""
+    message_box = ctypes.WinDLL("user32", use_last_error=True).MessageBoxW
+    message_box.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_uint]
+    message_box.restype = ctypes.c_int
+    return message_box
 
 
 def show_message(title: str, message: str, *, error: bool = False) -> None:
+    # Successes go to a tray balloon that needs no click; errors (or no tray) keep the dialog.
+    if not error and _notify(title, message):
+        return
     flags = MB_OK | (MB_ICONERROR if error else MB_ICONINFORMATION)
-    ctypes.windll.user32.MessageBoxW(None, message, title, flags)
+    _message_box_w()(None, message, title, flags)
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", ctypes.c_ulong),
+        ("Data2", ctypes.c_ushort),
+        ("Data3", ctypes.c_ushort),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+def _guid(text: str) -> _GUID:
+    guid = _GUID()
+    ctypes.oledll.ole32.CLSIDFromString(text, ctypes.byref(guid))
+    return guid
+
+
+class _FILETIME(ctypes.Structure):
+    _fields_ = [("dwLowDateTime", ctypes.c_ulong), ("dwHighDateTime", ctypes.c_ulong)]
+
+
+class _CREDENTIALW(ctypes.Structure):
+    _fields_ = [
+        ("Flags", ctypes.c_ulong),
+        ("Type", ctypes.c_ulong),
+        ("TargetName", ctypes.c_wchar_p),
+        ("Comment", ctypes.c_wchar_p),
+        ("LastWritten", _FILETIME),
+        ("CredentialBlobSize", ctypes.c_ulong),
+        ("CredentialBlob", ctypes.POINTER(ctypes.c_ubyte)),
+        ("Persist", ctypes.c_ulong),
+        ("AttributeCount", ctypes.c_ulong),
+        ("Attributes", ctypes.c_void_p),
+        ("TargetAlias", ctypes.c_wchar_p),
+        ("UserName", ctypes.c_wchar_p),
+    ]
+
+
+def _read_credential(target: str) -> Optional[str]:
+    """Return the secret of a generic Credential Manager entry, or None if absent or off Windows."""
+    try:
+        advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+    cred_read = advapi32.CredReadW
+    cred_read.argtypes = [
+        ctypes.c_wchar_p,
+        ctypes.c_ulong,
+        ctypes.c_ulong,
+        ctypes.POINTER(ctypes.POINTER(_CREDENTIALW)),
+    ]
+    cred_read.restype = ctypes.c_int
+    cred_free = advapi32.CredFree
+    cred_free.argtypes = [ctypes.c_void_p]
+    cred_free.restype = None
+
+    credential = ctypes.POINTER(_CREDENTIALW)()
+    if not cred_read(target, CRED_TYPE_GENERIC, 0, ctypes.byref(credential)):
+        return None
+    try:
+        blob = ctypes.string_at(credential.contents.CredentialBlob, credential.contents.CredentialBlobSize)
+    finally:
+        cred_free(credential)
+    # cmdkey and Credential Manager store the secret as UTF-16; other tools may write UTF-8.
+    secret = blob.decode("utf-16-le" if b"\x00" in blob else "utf-8", "replace")
+    return secret.strip() or None
+
+
+class _NOTIFYICONDATAW(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", ctypes.c_ulong),
+        ("hWnd", ctypes.c_void_p),
+        ("uID", ctypes.c_uint),
+        ("uFlags", ctypes.c_uint),
+        ("uCallbackMessage", ctypes.c_uint),
+        ("hIcon", ctypes.c_void_p),
+        ("szTip", ctypes.c_wchar * 128),
+        ("dwState", ctypes.c_ulong),
+        ("dwStateMask", ctypes.c_ulong),
+        ("szInfo", ctypes.c_wchar * 256),
+        ("uTimeout", ctypes.c_uint),
+        ("szInfoTitle", ctypes.c_wchar * 64),
+        ("dwInfoFlags", ctypes.c_ulong),
+        ("guidItem", _GUID),
+        ("hBalloonIcon", ctypes.c_void_p),
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_api():
+    """Resolve the user32/shell32 calls behind tray notifications once, with explicit signatures."""
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    create_window = user32.CreateWindowExW
+    create_window.argtypes = [
+        ctypes.c_ulong,
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_ulong,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+    ]
+    create_window.restype = ctypes.c_void_p
+    destroy_window = user32.DestroyWindow
+    destroy_window.argtypes = [ctypes.c_void_p]
+    destroy_window.restype = ctypes.c_int
+    load_icon = user32.LoadIconW
+    load_icon.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    load_icon.restype = ctypes.c_void_p
+    notify_icon = shell32.Shell_NotifyIconW
+    notify_icon.argtypes = [ctypes.c_ulong, ctypes.POINTER(_NOTIFYICONDATAW)]
+    notify_icon.restype = ctypes.c_int
+    return create_window, destroy_window, load_icon, notify_icon
+
+
+def _notify(title: str, message: str) -> bool:
+    """Show ``message`` as a tray balloon for a few seconds; False if it could not be shown."""
+    try:
+        create_window, destroy_window, load_icon, notify_icon = _tray_api()
+    except (AttributeError, OSError):
+        return False
+    # A message-only window of a predefined class owns the icon; pythonw has no window of its own.
+    hwnd = create_window(0, "STATIC", title, 0, 0, 0, 0, 0, HWND_MESSAGE, None, None, None)
+    if not hwnd:
+        return False
+    data = _NOTIFYICONDATAW()
+    data.cbSize = ctypes.sizeof(data)
+    data.hWnd = hwnd
+    data.uID = 1
+    data.uFlags = NIF_ICON | NIF_TIP | NIF_INFO
+    data.hIcon = load_icon(None, IDI_INFORMATION)
+    data.szTip = title[:127]
+    data.szInfoTitle = title[:63]
+    data.szInfo = message if len(message) < 256 else message[:254] + "\u2026"
+    data.dwInfoFlags = NIIF_INFO
+    try:
+        if not notify_icon(NIM_ADD, ctypes.byref(data)):
+            return False
+        # Removing the icon also dismisses its balloon, so keep it up briefly before exiting.
+        time.sleep(NOTIFY_DISPLAY_SEC)
+        notify_icon(NIM_DELETE, ctypes.byref(data))
+        return True
+    finally:
+        destroy_window(hwnd)
+
+
+class _TaskbarProgress:
+    """Percent-complete on the console window's taskbar button, through ITaskbarList3."""
+
+    # Vtable slots: IUnknown occupies 0-2 and ITaskbarList/ITaskbarList2 occupy 3-8.
+    _RELEASE = 2
+    _HR_INIT = 3
+    _SET_PROGRESS_VALUE = 9
+    _SET_PROGRESS_STATE = 10
+    _SCALE = 1000
+
+    def __init__(self, hwnd: int, taskbar: ctypes.c_void_p) -> None:
+        self._hwnd = hwnd
+        self._taskbar = taskbar
+
+    @classmethod
+    def create(cls) -> Optional["_TaskbarProgress"]:
+        """Return a progress indicator, or None without a console window (pythonw) or off Windows."""
+        try:
+            get_console_window = ctypes.windll.kernel32.GetConsoleWindow
+            get_console_window.restype = ctypes.c_void_p
+            hwnd = get_console_window()
+            if not hwnd:
+                return None
+            ole32 = ctypes.oledll.ole32
+            ole32.CoInitialize(None)
+            taskbar = ctypes.c_void_p()
+            ole32.CoCreateInstance(
+                ctypes.byref(_guid(CLSID_TASKBAR_LIST)),
+                None,
+                CLSCTX_INPROC_SERVER,
+                ctypes.byref(_guid(IID_ITASKBAR_LIST3)),
+                ctypes.byref(taskbar),
+            )
+            progress = cls(hwnd, taskbar)
+            progress._call(cls._HR_INIT, ())
+        except (AttributeError, OSError):
+            return None
+        return progress
+
+    def _call(self, slot: int, argtypes: tuple, *args, restype=None):
+        vtable = ctypes.cast(self._taskbar, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+        prototype = ctypes.WINFUNCTYPE(restype or ctypes.HRESULT, ctypes.c_void_p, *argtypes)
+        return prototype(vtable[slot])(self._taskbar, *args)
+
+    def update(self, fraction: Optional[float]) -> None:
+        """Show ``fraction`` complete, or an indeterminate bar when it is None."""
+        try:
+            if fraction is None:
+                self._call(self._SET_PROGRESS_STATE, (ctypes.c_void_p, ctypes.c_int), self._hwnd, TBPF_INDETERMINATE)
+                return
+            self._call(self._SET_PROGRESS_STATE, (ctypes.c_void_p, ctypes.c_int), self._hwnd, TBPF_NORMAL)
+            self._call(
+                self._SET_PROGRESS_VALUE,
+                (ctypes.c_void_p, ctypes.c_ulonglong, ctypes.c_ulonglong),
+                self._hwnd,
+                int(min(max(fraction, 0.0), 1.0) * self._SCALE),
+                self._SCALE,
+            )
+        except OSError:
+            pass  # Progress is cosmetic; never let it interrupt processing.
+
+    def close(self) -> None:
+        try:
+            self._call(self._SET_PROGRESS_STATE, (ctypes.c_void_p, ctypes.c_int), self._hwnd, TBPF_NOPROGRESS)
+        except OSError:
+            pass
+        self._call(self._RELEASE, (), restype=ctypes.c_ulong)
+
+
+def _cache_path() -> Path:
+    root = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    return Path(root) / "audio-to-notes" / "cache.json"
+
+
+def _cache_key(path: Path, *settings: object) -> Optional[str]:
+    """Key a file by a digest of its contents plus the settings that shape its outputs."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(functools.partial(f.read, 1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return ":".join([digest.hexdigest()[:16], *map(str, settings)])
+
+
+def _load_cache() -> dict[str, dict]:
+    try:
+        with open(_cache_path(), encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+@contextlib.contextmanager
+def _cache_lock(lock_path: Path):
+    """Hold an exclusive lock file for a cache save, taking over one left behind by a crashed run."""
+    deadline = time.monotonic() + CACHE_LOCK_WAIT_SEC
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                stale = time.time() - lock_path.stat().st_mtime > CACHE_LOCK_WAIT_SEC
+            except OSError:
+                stale = False
+            if stale or time.monotonic() > deadline:
+                lock_path.unlink(missing_ok=True)
+            else:
+                time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        lock_path.unlink(missing_ok=True)
 
 
+def _save_cache(entries: dict[str, dict], removed: Iterable[str] = ()) -> None:
+    cache_path = _cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with _cache_lock(cache_path.with_suffix(".lock")):
+            _merge_and_write_cache(cache_path, entries, removed)
+    except OSError:
+        pass  # The cache only saves rework; a run never fails because it could not be written.
+
+
+def _merge_and_write_cache(cache_path: Path, entries: dict[str, dict], removed: Iterable[str]) -> None:
+    # A multi-select in Explorer starts one process per file, all saving at once: merge with
+    # whatever the others wrote since this run loaded the cache, keeping the newer entry.
+    merged = _load_cache()
+    # Entries this run dropped as stale must not come back from the on-disk copy.
+    for key in removed:
+        if key not in entries:
+            merged.pop(key, None)
+    for key, entry in entries.items():
+        current = merged.get(key)
+        if not isinstance(current, dict) or current.get("used", 0) <= entry.get("used", 0):
+            merged[key] = entry
+    if len(merged) > CACHE_MAX_ENTRIES:
+        recent = sorted(merged.items(), key=lambda item: item[1].get("used", 0), reverse=True)
+        merged = dict(recent[:CACHE_MAX_ENTRIES])
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix="cache-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(merged, f)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _cache_lookup(entries: dict[str, dict], key: Optional[str], output_dir: Path) -> Optional[dict[str, Path]]:
+    """Return cached output paths for ``key`` if the files are still on disk in ``output_dir``."""
+    entry = entries.get(key) if key else None
+    if not isinstance(entry, dict):
+        return None
+    outputs = {name: Path(value) for name, value in entry.get("outputs", {}).items()}
+    if not outputs or not all(path.parent == output_dir and path.is_file() for path in outputs.values()):
+        entries.pop(key, None)
+        return None
+    entry["used"] = time.time()
+    return outputs
+
+
+def _find_missing(paths: list[Path]) -> set[int]:
+    """Return the indices of inputs that are not files, reading each shared folder only once."""
+    by_parent: dict[str, list[int]] = {}
+    for index, path in enumerate(paths):
+        by_parent.setdefault(os.path.dirname(os.path.abspath(path)), []).append(index)
+
+    missing: set[int] = set()
+    for parent, indices in by_parent.items():
+        if len(indices) == 1:
+            if not paths[indices[0]].is_file():
+                missing.add(indices[0])
+            continue
+        # DirEntry file types come from the directory read itself, so several inputs from
+        # one folder cost a single listing instead of a stat each.
+        try:
+            with os.scandir(parent) as entries:
+                files = {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+        except OSError:
+            files = set()
+        missing.update(index for index in indices if os.path.normcase(paths[index].name) not in files)
+    return missing
+
+
+def _start_model_warmup(load) -> threading.Thread:
+    """Run ``load`` on a background thread, leaving any failure for the first real call to report."""
+
+    def _warm() -> None:
+        try:
+            load()
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=_warm, name="audio-notes-warmup")
+    thread.start()
+    return thread
+
+
+def _release_model(get_transcriber) -> None:
+    """Free the cached transcriber and its GPU memory once no more files need it."""
+    if get_transcriber.cache_info().currsize:
+        get_transcriber().close()
+        get_transcriber.cache_clear()
+
+
+@functools.cache
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
-            "Windows entry point for the Audio-to-Notes application. Processes a single audio file "
-            "and drops the transcript + notes alongside the source file."
+            "Windows entry point for the Audio-to-Notes application. Processes one or more audio files "
+            "and drops the transcript + notes alongside each source file."
         )
     )
-    parser.add_argument("input_path", help="Audio file to transcribe and summarize.")
+    parser.add_argument("input_paths", nargs="+", help="Audio file(s) to transcribe and summarize.")
     parser.add_argument(
         "--api-key",
         dest="api_key",
-        help="Optional OpenAI API key override. Falls back to OPENAI_API_KEY environment variable.",
+        help=(
+            f"Optional OpenAI API key override. Falls back to the '{CREDENTIAL_TARGET}' Credential Manager "
+            "entry, then the OPENAI_API_KEY environment variable."
+        ),
     )
     parser.add_argument(
         "--chunk-length",
         type=int,
-        default=DEFAULT_CHUNK_LENGTH_SEC,
-        help="Chunk length in seconds when splitting long audio (default: 600).",
+        default=None,
+        help="Chunk length in seconds when splitting long audio (default: the app's chunk length).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Number of chunks transcribed per model call (default: the app's batch size).",
+    )
+    parser.add_argument(
+        "--split-mode",
+        # Mirrors app.SPLIT_MODES; spelled out so a bad value fails before app is imported.
+        choices=("fixed", "vad"),
+        default=None,
+        help="How long audio is cut into chunks: a fixed grid, or at detected silences (default: fixed).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate outputs even if this exact file was already processed with the same settings.",
     )
     parser.add_argument(
         "--silent",
@@ -48,34 +466,140 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    # The Explorer context menu passes exactly one path and no flags; that launch skips argparse.
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        return argparse.Namespace(
+            input_paths=[argv[0]],
+            api_key=None,
+            chunk_length=None,
+            batch_size=None,
+            split_mode=None,
+            no_cache=False,
+            silent=False,
+        )
+    return build_parser().parse_args(argv)
+
+
 def main(argv: Optional[list[str]] = None) -> None:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    args = parse_args(argv)
 
-    api_key = ensure_api_key(args.api_key)
+    # Imported only once the arguments are valid, so --help and usage errors return
+    # without loading torch, NeMo and the OpenAI client.
+    from app import (
+        DEFAULT_BATCH_SIZE,
+        DEFAULT_CHUNK_LENGTH_SEC,
+        DEFAULT_MODEL_NAME,
+        DEFAULT_SPLIT_MODE,
+        ensure_api_key,
+        get_transcriber,
+        process_files,
+    )
 
-    target_path = Path(args.input_path).expanduser()
-    try:
-        result = process_file(
-            target_path,
-            api_key,
-            chunk_length_sec=args.chunk_length,
-            skip_existing=False,
+    chunk_length = DEFAULT_CHUNK_LENGTH_SEC if args.chunk_length is None else args.chunk_length
+    batch_size = DEFAULT_BATCH_SIZE if args.batch_size is None else args.batch_size
+    split_mode = args.split_mode or DEFAULT_SPLIT_MODE
+
+    api_key = ensure_api_key(args.api_key or _read_credential(CREDENTIAL_TARGET))
+
+    target_paths = [Path(input_path).expanduser() for input_path in args.input_paths]
+    if len(target_paths) > 1:
+        # Drag-and-drop selections and playlists can name one file several times (or through
+        # different spellings); keep the first mention of each so it is transcribed once.
+        unique: dict[str, Path] = {}
+        for path in target_paths:
+            unique.setdefault(os.path.normcase(os.path.realpath(path)), path)
+        if len(unique) < len(target_paths):
+            print(f"Ignoring {len(target_paths) - len(unique)} duplicate input path(s).")
+            target_paths = list(unique.values())
+    # Unchanged files already processed with the same settings reuse their earlier outputs.
+    cache = {} if args.no_cache else _load_cache()
+    loaded_keys = set(cache)
+    cache_keys: list[Optional[str]] = []
+    outcomes: list[FileResult] = [None] * len(target_paths)
+    pending: list[int] = []
+    reused: set[Path] = set()
+    warmup: Optional[threading.Thread] = None
+    missing = _find_missing(target_paths)
+    for index, path in enumerate(target_paths):
+        if index in missing:
+            cache_keys.append(None)
+            outcomes[index] = FileNotFoundError(f"Audio file not found: {path}")
+            continue
+        # Outputs are written beside the resolved file, so a copy elsewhere is its own entry.
+        output_dir = Path(os.path.realpath(path)).parent
+        cache_keys.append(
+            None if args.no_cache else _cache_key(path, output_dir, chunk_length, split_mode, DEFAULT_MODEL_NAME)
         )
-    except Exception as exc:
-        tb = traceback.format_exc()
-        if not args.silent:
+        cached = _cache_lookup(cache, cache_keys[index], output_dir)
+        if cached is None:
+            pending.append(index)
+            # The model is needed from the first miss on; loading it now overlaps the
+            # load with hashing the remaining inputs.
+            if warmup is None:
+                warmup = _start_model_warmup(get_transcriber)
+        else:
+            print(f"Reusing earlier outputs for {path.name}.")
+            outcomes[index] = cached
+            reused.add(path)
+
+    if warmup is not None:
+        warmup.join()
+
+    if pending:
+        taskbar = _TaskbarProgress.create()
+
+        def _on_progress(position: int, done: int, total: int) -> None:
+            if taskbar is not None:
+                taskbar.update((position + done / total) / len(pending) if total else None)
+
+        # All files share one interpreter and one model load; notes for earlier files are
+        # generated while later ones transcribe.
+        try:
+            processed = process_files(
+                [target_paths[index] for index in pending],
+                api_key,
+                chunk_length_sec=chunk_length,
+                batch_size=batch_size,
+                split_mode=split_mode,
+                skip_existing=False,
+                progress_callback=_on_progress,
+            )
+        finally:
+            if taskbar is not None:
+                taskbar.close()
+        for index, (_, result) in zip(pending, processed):
+            outcomes[index] = result
+            key = cache_keys[index]
+            if key and isinstance(result, dict):
+                cache[key] = {"outputs": {name: str(path) for name, path in result.items()}, "used": time.time()}
+    if not args.no_cache:
+        _save_cache(cache, removed=loaded_keys - cache.keys())
+    # The tray balloon keeps the process up for a few seconds; don't hold the model through it.
+    _release_model(get_transcriber)
+
+    results = list(zip(target_paths, outcomes))
+    if len(results) == 1:
+        _report_single(*results[0], reused=results[0][0] in reused, silent=args.silent)
+    else:
+        _report_many(results, reused=reused, silent=args.silent)
+
+
+def _report_single(target_path: Path, result: FileResult, *, reused: bool, silent: bool) -> None:
+    if isinstance(result, Exception):
+        if not silent:
             show_message(
-                "Create Notes",
-                f"Failed to process '{target_path.name}'.\n{exc}",
+                _TITLE,
+                f"Failed to process '{target_path.name}'.\n{result}",
                 error=True,
             )
-        raise SystemExit(1) from exc
+        raise SystemExit(1) from result
 
     if result is None:
-        if not args.silent:
+        if not silent:
             show_message(
-                "Create Notes",
+                _TITLE,
                 f"No notes were generated for '{target_path.name}'.",
                 error=True,
             )
@@ -84,16 +608,46 @@ def main(argv: Optional[list[str]] = None) -> None:
     transcription_path = result["transcription_path"]
     notes_path = result["notes_path"]
 
-    if not args.silent:
+    if not silent:
         show_message(
-            "Create Notes",
+            _TITLE,
             (
-                f"Created transcription and notes for '{target_path.name}'.\n\n"
+                f"{'Reused earlier' if reused else 'Created'} transcription and notes for '{target_path.name}'.\n\n"
                 f"Transcription: {transcription_path.name}\n"
                 f"Notes: {notes_path.name}"
             ),
         )
 
 
+def _report_many(
+    results: list[tuple[Path, FileResult]],
+    *,
+    reused: set[Path],
+    silent: bool,
+) -> None:
+    created = [path for path, result in results if isinstance(result, dict) and path not in reused]
+    reused_paths = [path for path, result in results if isinstance(result, dict) and path in reused]
+    failed = [(path, result) for path, result in results if isinstance(result, Exception)]
+    skipped = [path for path, result in results if result is None]
+
+    if not silent:
+        lines = [f"Created transcription and notes for {len(created)} of {len(results)} file(s)."]
+        if reused_paths:
+            lines.append("\nReused earlier notes (file unchanged):")
+            lines.extend(f"- {path.name}" for path in reused_paths)
+        if failed:
+            lines.append("\nFailed:")
+            lines.extend(f"- {path.name}: {exc}" for path, exc in failed)
+        if skipped:
+            lines.append("\nNo notes generated:")
+            lines.extend(f"- {path.name}" for path in skipped)
+        show_message(_TITLE, "\n".join(lines), error=bool(failed or skipped))
+
+    if failed:
+        raise SystemExit(1)
+    if skipped:
+        raise SystemExit(2)
+
+
 if __name__ == "__main__":
     main(sys.argv[1:])